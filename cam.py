@@ -1,7 +1,26 @@
 import cv2
 import tkinter as tk
-from threading import Thread
+from threading import Thread, Lock
 from tkinter import messagebox
+from PIL import Image, ImageTk
+
+def open_camera(idx, backend):
+    """Open a camera and make sure it actually delivers a frame."""
+    cap = cv2.VideoCapture(idx, backend)
+    # grab() catches dead devices that still report isOpened(), without decoding
+    if cap.isOpened() and cap.grab():
+        return cap
+    cap.release()
+    return None
+
+def find_camera(max_index=10):
+    """Return (cap, index) for the first working camera, probing fast backends only."""
+    for backend in (cv2.CAP_DSHOW, cv2.CAP_MSMF):
+        for i in range(max_index):
+            cap = open_camera(i, backend)
+            if cap:
+                return cap, i
+    return None, None
 
 class FastLiveCamera:
     def __init__(self, master):
@@ -19,10 +38,14 @@ class FastLiveCamera:
         self.cap = None
 
         self.prev_settings = {}  # Track previous values to avoid redundant sets
+        self.dirty = True  # Settings changed since they were last applied
+        for var in (self.res_width, self.res_height, self.brightness, self.contrast):
+            var.trace_add("write", lambda *args: setattr(self, "dirty", True))
 
         # --- GUI ---
         tk.Label(master, text="Camera Index:").grid(row=0, column=0, sticky="e")
         tk.Entry(master, textvariable=self.camera_index, width=8).grid(row=0, column=1)
+        tk.Button(master, text="Find Camera", command=self.detect_camera).grid(row=0, column=2, padx=5)
 
         tk.Label(master, text="Resolution Width:").grid(row=1, column=0, sticky="e")
         tk.Entry(master, textvariable=self.res_width, width=8).grid(row=1, column=1)
@@ -39,6 +62,15 @@ class FastLiveCamera:
         tk.Button(master, text="Start Camera", command=self.start_camera).grid(row=5, column=0, pady=10)
         tk.Button(master, text="Stop Camera", command=self.stop_camera).grid(row=5, column=1, pady=10)
 
+        # Preview is drawn by Tk itself, no separate HighGUI window
+        self.img_label = tk.Label(master)
+        self.img_label.grid(row=6, column=0, columnspan=3)
+        self.photo = None
+        self.rgb_buf = None  # Reused for every frame, guarded by frame_lock
+        self.frame_lock = Lock()
+        self.new_frame = False
+        master.bind("<Escape>", lambda event: self.stop_camera())
+
     def start_camera(self):
         if self.running:
             return
@@ -49,23 +81,34 @@ class FastLiveCamera:
             return
 
         # Use DirectShow backend
-        self.cap = cv2.VideoCapture(idx, cv2.CAP_DSHOW)
-        if not self.cap.isOpened():
+        self.cap = open_camera(idx, cv2.CAP_DSHOW)
+        if not self.cap:
             messagebox.showerror("Error", f"Cannot open camera {idx}")
             return
+        self.begin_capture()
+
+    def detect_camera(self):
+        if self.running:
+            return
+        self.cap, found = find_camera()
+        if not self.cap:
+            messagebox.showerror("Error", "No working camera found")
+            return
+        self.camera_index.set(str(found))
+        self.begin_capture()
 
+    def begin_capture(self):
         self.running = True
         self.prev_settings = {}
-        Thread(target=self.update_frame, daemon=True).start()
+        self.dirty = True
+        Thread(target=self.update_frame, args=(self.cap,), daemon=True).start()
+        self.show_frame()
 
     def stop_camera(self):
+        # The capture thread owns its cap and releases it once its loop exits
         self.running = False
-        if self.cap:
-            self.cap.release()
-            self.cap = None
-        cv2.destroyAllWindows()
 
-    def apply_settings(self):
+    def apply_settings(self, cap):
         # Only apply if changed
         try:
             settings = {
@@ -80,27 +123,48 @@ class FastLiveCamera:
         for key, value in settings.items():
             if self.prev_settings.get(key) != value:
                 if key == "width":
-                    self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, value)
+                    cap.set(cv2.CAP_PROP_FRAME_WIDTH, value)
                 elif key == "height":
-                    self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, value)
+                    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, value)
                 elif key == "brightness":
-                    self.cap.set(cv2.CAP_PROP_BRIGHTNESS, value)
+                    cap.set(cv2.CAP_PROP_BRIGHTNESS, value)
                 elif key == "contrast":
-                    self.cap.set(cv2.CAP_PROP_CONTRAST, value)
+                    cap.set(cv2.CAP_PROP_CONTRAST, value)
                 self.prev_settings[key] = value
 
-    def update_frame(self):
-        while self.running and self.cap:
-            self.apply_settings()
+    def update_frame(self, cap):
+        # A restart replaces self.cap, which also ends this loop
+        while self.running and self.cap is cap:
+            if self.dirty:
+                self.dirty = False
+                self.apply_settings(cap)
 
-            ret, frame = self.cap.read()
+            ret, frame = cap.read()
             if not ret:
                 continue
 
-            cv2.imshow("Live Camera", frame)
-            if cv2.waitKey(1) == 27:  # ESC
-                self.stop_camera()
-                break
+            with self.frame_lock:
+                if self.rgb_buf is None or self.rgb_buf.shape != frame.shape:
+                    self.rgb_buf = frame.copy()
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.rgb_buf)
+                self.new_frame = True
+
+        cap.release()
+
+    def show_frame(self):
+        # Runs on the Tk thread; Tk objects must not be touched from the capture thread
+        if not self.running:
+            return
+        with self.frame_lock:
+            if self.new_frame:
+                self.new_frame = False
+                image = Image.fromarray(self.rgb_buf)
+                if self.photo is None or (self.photo.width(), self.photo.height()) != image.size:
+                    self.photo = ImageTk.PhotoImage(image)
+                    self.img_label.configure(image=self.photo)
+                else:
+                    self.photo.paste(image)
+        self.master.after(10, self.show_frame)
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -7,6 +7,10 @@ import argparse
 from chromaconsole import *
 import datetime
 import threading
+import collections
+import queue
+import io
+import re
 import simpleaudio as sa
 
 # ---------------- SETTINGS ----------------
@@ -32,6 +36,12 @@ def parse_args():
         default="a.gcode",
         help="Path to the G-code file (.gcode)"
     )
+    parser.add_argument(
+        "--window", "-w",
+        type=int,
+        default=4,
+        help="Commands sent ahead of the printer's 'ok' (default: 4, Marlin's BUFSIZE)"
+    )
     parser.add_argument(
         "--frames_dir", "-fd",
         type=str,
@@ -47,7 +57,14 @@ def parse_args():
     parser.add_argument(
         "--record", "-r",
         action="store_true",
-        help="Enable recording frames (saves PNGs for each layer)"
+        help="Enable recording frames (saves an image for each layer)"
+    )
+    parser.add_argument(
+        "--frame_format", "-ff",
+        type=str,
+        choices=["jpg", "png", "bmp"],
+        default="jpg",
+        help="Image format for saved frames: jpg, png or bmp for lossless without compression (default: jpg)"
     )
     parser.add_argument(
         "--camera_resolution", "-cr",
@@ -72,6 +89,11 @@ def parse_args():
         action="store_true",
         help="Play elevator.wav on loop while printing"
     )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Don't log every sent command and printer reply, only heating, pictures and errors"
+    )
     return parser.parse_args()
 # ------------------------------------------
 
@@ -80,74 +102,352 @@ args = parse_args()
 PORT = args.port
 BAUDRATE = args.baudrate
 GCODE_FILE = args.gcode_file if args.gcode_file.endswith('.gcode') else args.gcode_file + '.gcode'
+WINDOW = max(args.window, 1)
 FRAMES_DIR = args.frames_dir
 CAMERA_INDEX = args.camera_index
 RECORD = args.record
+FRAME_FORMAT = args.frame_format
 CAMERA_RESOLUTION = tuple(map(int, args.camera_resolution.split('x')))
 CAMERA_BRIGHTNESS = args.camera_brightness
 CAMERA_CONTRAST = args.camera_contrast
 ELEVATOR_MUSIC = args.elevator_music
+QUIET = args.quiet
 # ------------------------------------------
 
+# Color escapes, built once instead of on every log line
+_BLU = Color.Text.br_blue()
+_CYN = Color.Text.br_cyan()
+_MAG = Color.Text.br_magenta()
+_RED = Color.Text.br_red()
+_WHT = Color.Text.br_white()
+_YEL = Color.Text.br_yellow()
+_RST = Style.reset()
+
+# Threads: the main loop streams G-code, serial_reader consumes printer output,
+# grab_frames keeps the camera current and frame_writer workers encode and save
+# pictures, so serial I/O, capture and encoding all overlap.
+
 if RECORD:
     os.makedirs(FRAMES_DIR, exist_ok=True)
     cap = cv2.VideoCapture(CAMERA_INDEX)
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))  # compressed frames, decoded only on retrieve()
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_RESOLUTION[0])
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_RESOLUTION[1])
     cap.set(cv2.CAP_PROP_BRIGHTNESS, CAMERA_BRIGHTNESS)
     cap.set(cv2.CAP_PROP_CONTRAST, CAMERA_CONTRAST)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # keep only the newest frame in the driver
 else:
     cap = None
 
+_FRAMES_PREFIX = os.path.join(FRAMES_DIR, "frame")  # joined once, not per picture
+
+FRAME_PARAMS = {
+    "jpg": [cv2.IMWRITE_JPEG_QUALITY, 90],
+    "png": [cv2.IMWRITE_PNG_COMPRESSION, 1],  # favour speed, frames get re-encoded anyway
+    "bmp": [],
+}[FRAME_FORMAT]
+
+cap_lock = threading.Lock()  # grab() and retrieve() must not run at the same time
+camera_stop = threading.Event()
+
+def grab_frames():
+    """Keep advancing the stream so retrieve() always returns the latest frame."""
+    while not camera_stop.is_set():
+        with cap_lock:
+            ok = cap.grab()
+        if not ok:
+            time.sleep(0.01)
+
+if cap:
+    grab_thread = threading.Thread(target=grab_frames, daemon=True)
+    grab_thread.start()
+
 # Connect to printer
 ser = serial.Serial(PORT, BAUDRATE, timeout=5)
+# Linux USB-serial drivers batch input for up to 16 ms; ASYNC_LOW_LATENCY drops that to ~1 ms
+if hasattr(ser, "set_low_latency_mode"):
+    try:
+        ser.set_low_latency_mode(True)
+    except (OSError, ValueError) as e:
+        tqdm.write(f"{_RED}[!] Could not enable low latency mode: {e}{_RST}")
 time.sleep(2)  # wait for connection
 
-def send_gcode(cmd):
-    """Send a command to the printer and wait for 'ok'."""
-    tqdm.write(f"{Color.Text.br_magenta()}[←] {cmd}{Style.reset()}")
-    ser.write((cmd + "\n").encode())
+# -------- Serial streaming --------
+RX_BUFFER = 128  # Marlin's default RX_BUFFER_SIZE; unacknowledged bytes must fit in it
+ACK_TIMEOUT = 30  # seconds without any sign of progress before an 'ok' is assumed lost
+RESEND_TIMEOUT = 2  # seconds of silence before a resend that went unanswered is repeated
+
+ok_cond = threading.Condition()  # guards in_flight and every write to the port
+in_flight = collections.deque()  # sizes of lines still waiting for an 'ok', oldest first
+in_flight_bytes = 0
+last_progress = time.monotonic()
+line_number = 0
+sent_history = collections.deque(maxlen=64)  # (N, payload) kept around for resend requests
+resend_n = None  # line the printer asked for, until a normal 'ok' shows it arrived
+resend_repeats = 0  # lines sent before that resend, which may each repeat the request
+temps = {}
+temp_cond = threading.Condition()  # notified whenever a temperature report arrives
+reader_running = True
+
+def checksum(payload):
+    """Marlin line checksum: XOR of every byte before the '*'."""
+    cs = 0
+    for c in payload:
+        cs ^= c
+    return cs
+
+def track(payload):
+    """Count a line as in flight. Caller must hold ok_cond."""
+    global in_flight_bytes
+    in_flight.append(len(payload))
+    in_flight_bytes += len(payload)
+
+def ack():
+    """Retire the oldest in-flight line. Caller must hold ok_cond."""
+    global in_flight_bytes, last_progress
+    last_progress = time.monotonic()
+    if in_flight:
+        in_flight_bytes -= in_flight.popleft()
+    ok_cond.notify_all()
+
+def wait_for_ack(predicate):
+    """Wait on ok_cond until predicate holds, giving up on an 'ok' that never comes."""
+    while not ok_cond.wait_for(predicate, timeout=1):
+        idle = time.monotonic() - last_progress
+        if resend_n is not None and idle > RESEND_TIMEOUT:
+            # The re-sent line was rejected too and taken for a repeat; send it again
+            resend_from(resend_n, force=True)
+        elif in_flight and idle > ACK_TIMEOUT:
+            tqdm.write(f"{_RED}[!] No 'ok' from printer for {ACK_TIMEOUT}s, assuming it was lost{_RST}")
+            ack()
+
+def resend_from(n, force=False):
+    """Re-send every in-flight line starting at N after the printer asked for it."""
+    global in_flight_bytes, last_progress, resend_n, resend_repeats
+    with ok_cond:
+        if not force and n == resend_n and resend_repeats:
+            # Lines sent before the resend fail the same way, each asking for N again
+            resend_repeats -= 1
+            return
+        stale = [payload for num, payload in sent_history if num >= n]
+        for payload in stale:
+            ser.write(payload)
+        # The printer flushed whatever else it had buffered, so only these are in flight
+        in_flight.clear()
+        in_flight_bytes = 0
+        for payload in stale:
+            track(payload)
+        resend_n = n
+        resend_repeats = max(len(stale) - 1, 0)
+        last_progress = time.monotonic()
+        ok_cond.notify_all()
+    tqdm.write(f"{_RED}[!] Printer requested resend from line {n}{_RST}")
+
+# Anchored so tokens like EXTRUDER_COUNT:1 or BUILD_PERCENT:0 aren't taken for temperatures
+_T_NOZZLE_RE = re.compile(rb"(?:^|\s)T:\s*(-?[\d.]+)")
+_T_BED_RE = re.compile(rb"(?:^|\s)B:\s*(-?[\d.]+)")
+
+def update_temps(raw):
+    """Remember the latest temperatures from a raw temperature report."""
+    for key, regex in (("T", _T_NOZZLE_RE), ("B", _T_BED_RE)):
+        m = regex.search(raw)
+        if m:
+            try:
+                with temp_cond:
+                    temps[key] = float(m.group(1))
+                    temp_cond.notify_all()
+            except ValueError:
+                pass
+
+class SerialLineReader:
+    """Drain everything waiting on the port in one read and split it into lines."""
+
+    def __init__(self, ser):
+        self.ser = ser
+        self.buf = bytearray()
+
+    def lines(self):
+        """Yield the complete lines received so far, keeping any partial line buffered."""
+        n = self.ser.in_waiting
+        if n:
+            self.buf += self.ser.read(n)
+        if b"\n" not in self.buf:
+            time.sleep(0.001)  # nothing complete yet, don't spin
+            return
+        *lines, self.buf = self.buf.split(b"\n")
+        yield from lines
+
+def serial_reader():
+    """Read everything the printer sends and count the 'ok's."""
+    global last_progress, resend_n
+    line_reader = SerialLineReader(ser)
+    after_resend = False
+    while reader_running:
+        for raw in line_reader.lines():
+            raw = raw.strip()
+            if not raw:
+                continue
+            if raw[:5].lower() == b"error":
+                tqdm.write(f"{_RED}[!] Printer: {raw.decode(errors='ignore')}{_RST}")
+            elif not QUIET:  # per-line logging; skipped before the message is even built
+                tqdm.write(f"{_YEL}[→] Printer: {raw.decode(errors='ignore')}{_RST}")
+            update_temps(raw)
+            head = raw[:6].lower()
+            if head.startswith(b"ok"):
+                with ok_cond:
+                    if after_resend:
+                        # Every resend request is followed by an 'ok' for the rejected line
+                        after_resend = False
+                    else:
+                        resend_n = None
+                        ack()
+            elif head == b"resend" or head.startswith(b"rs "):
+                after_resend = True
+                try:
+                    resend_from(int(raw.split(b":")[-1].split()[-1]))
+                except (IndexError, ValueError):
+                    pass
+            elif b"busy" in raw or b" W:" in raw:
+                # Long commands (homing, heating waits) hold their 'ok' but keep reporting
+                with ok_cond:
+                    last_progress = time.monotonic()
+
+def reset_line_number():
+    """Tell the printer to start counting lines from zero."""
+    global line_number
+    with ok_cond:
+        line_number = 0
+        sent_history.clear()
+        ser.write(b"M110 N0\n")
+        track(b"M110 N0\n")
 
+def send_gcode(cmd):
+    """Send a command (bytes) to the printer once there is room in the window."""
+    if not QUIET:
+        tqdm.write(f"{_MAG}[←] {cmd.decode(errors='ignore')}{_RST}")
+    global line_number
+    with ok_cond:
+        line_number += 1
+        payload = b"N%d %s" % (line_number, cmd)
+        payload += b"*%d\n" % checksum(payload)
+        # Stay within both Marlin's command queue and its serial receive buffer
+        wait_for_ack(lambda: not in_flight or (
+            len(in_flight) < WINDOW and in_flight_bytes + len(payload) <= RX_BUFFER))
+        sent_history.append((line_number, payload))
+        ser.write(payload)
+        track(payload)
+
+def drain():
+    """Wait until every command sent so far has been acknowledged."""
+    with ok_cond:
+        wait_for_ack(lambda: not in_flight)
+
+reader_thread = threading.Thread(target=serial_reader, daemon=True)
+reader_thread.start()
+reset_line_number()
+send_gcode(b"M155 S1")  # have the printer report temperatures every second on its own
+
+WRITER_THREADS = 2  # frames being encoded/saved in parallel
+
+write_q = queue.Queue(maxsize=8)
+
+def frame_writer():
+    """Save queued frames so encoding never blocks G-code streaming."""
     while True:
-        line = ser.readline().decode(errors="ignore").strip()
-        if line:
-            tqdm.write(f"{Color.Text.br_yellow()}[→] Printer: {line}{Style.reset()}")
-        if "ok" in line.lower():
-            break
+        path, frame = write_q.get()
+        try:
+            # imencode releases the GIL while compressing; the write is plain file I/O
+            ok, buf = cv2.imencode(f".{FRAME_FORMAT}", frame, FRAME_PARAMS)
+            if not ok:
+                tqdm.write(f"{_RED}[!] Failed to encode image: {path}{_RST}")
+                continue
+            with open(path, "wb") as out:
+                out.write(buf.tobytes())
+        except (OSError, cv2.error) as e:
+            tqdm.write(f"{_RED}[!] Failed to save image: {path} ({e}){_RST}")
+        else:
+            tqdm.write(f"{_WHT}[📸] Saved picture: {path}{_RST}")
+        finally:
+            write_q.task_done()
+
+if cap:
+    for _ in range(WRITER_THREADS):
+        threading.Thread(target=frame_writer, daemon=True).start()
 
 def take_picture(layer):
-    """Take and save a picture with the camera."""
+    """Take a picture with the camera and queue it for saving."""
     if not RECORD or cap is None:
         return
-    ret, frame = cap.read()
+    with cap_lock:
+        ret, frame = cap.retrieve()  # decode only the most recently grabbed frame
     if ret:
-        path = os.path.join(FRAMES_DIR, f"frame{layer}.png")
-        # Ensure the frame is properly saved in PNG format
-        if not cv2.imwrite(path, frame):
-            tqdm.write(f"{Color.Text.br_red()}[!] Failed to save image: {path}{Style.reset()}")
-        else:
-            tqdm.write(f"{Color.Text.br_white()}[📸] Saved picture: {path}{Style.reset()}")
+        path = f"{_FRAMES_PREFIX}{layer}.{FRAME_FORMAT}"
+        write_q.put((path, frame.copy()))  # OpenCV may reuse the frame buffer
     else:
-        tqdm.write(f"{Color.Text.br_red()}[!] Failed to capture image{Style.reset()}")
+        tqdm.write(f"{_RED}[!] Failed to capture image{_RST}")
 
 def clean_line(line):
     """Remove comments and spaces."""
-    return line.split(";")[0].strip()
+    i = line.find(b";")
+    return (line if i < 0 else line[:i]).strip()
 
 def parse_temp(line):
     """Extract target temperature from gcode line safely."""
     line = clean_line(line)
-    if "S" in line:
-        try:
-            return float(line.split("S")[1])
-        except:
-            return None
-    return None
+    i = line.find(b"S")
+    if i < 0:
+        return None
+    j = line.find(b" ", i + 1)
+    try:
+        return float(line[i + 1:] if j < 0 else line[i + 1:j])
+    except ValueError:
+        return None
 
 def format_time(seconds):
     """Format seconds into HH:MM:SS."""
     return str(datetime.timedelta(seconds=int(seconds)))
 
+def handle_m104(line):
+    """Set nozzle temp (no wait)."""
+    target = parse_temp(line)
+    if target is not None:
+        send_gcode(line)
+
+TEMP_HYSTERESIS = 1.0  # °C below target still counted as reached, like Marlin's TEMP_WINDOW
+TEMP_REPORT_TIMEOUT = 5  # seconds to wait for a report after the printer's 'ok'
+
+def confirm_temp(key, target):
+    """Wait briefly for a report near target; the printer's 'ok' is what really counts."""
+    with temp_cond:
+        if not temp_cond.wait_for(lambda: temps.get(key, 0) >= target - TEMP_HYSTERESIS,
+                                  timeout=TEMP_REPORT_TIMEOUT):
+            tqdm.write(f"{_RED}[!] No temperature report near {target}°C, continuing on the printer's 'ok'{_RST}")
+
+def handle_m109(line):
+    """Set nozzle temp and wait for it."""
+    target = parse_temp(line)
+    if target is not None:
+        send_gcode(line)
+        tqdm.write(f"{_BLU}[🔥] Waiting for nozzle to reach {target}°C...{_RST}")
+        drain()  # Marlin only answers M109 once the nozzle is within TEMP_WINDOW
+        confirm_temp("T", target)
+
+def handle_m190(line):
+    """Set bed temp and wait for it."""
+    target = parse_temp(line)
+    if target is not None:
+        send_gcode(line)
+        tqdm.write(f"{_BLU}[🔥] Waiting for bed to reach {target}°C...{_RST}")
+        drain()  # Marlin only answers M190 once the bed is within TEMP_BED_WINDOW
+        confirm_temp("B", target)
+
+# First word of a G-code line -> handler
+HANDLERS = {
+    b"M104": handle_m104,
+    b"M109": handle_m109,
+    b"M190": handle_m190,
+}
+
 stop_music_flag = False
 
 def play_elevator_music():
@@ -158,7 +458,7 @@ def play_elevator_music():
             play_obj = wave_obj.play()
             play_obj.wait_done()  # wait until this loop finishes
     except Exception as e:
-        tqdm.write(f"{Color.Text.br_red()}[!] Failed to play elevator.wav: {e}{Style.reset()}")
+        tqdm.write(f"{_RED}[!] Failed to play elevator.wav: {e}{_RST}")
 
 def start_elevator_music():
     threading.Thread(target=play_elevator_music, daemon=True).start()
@@ -168,23 +468,39 @@ def stop_elevator_music():
     stop_music_flag = True
 
 # Count total non-comment lines in the G-code file
-def count_non_comment_lines(file_path):
-    with open(file_path, "r") as f:
-        return sum(1 for line in f if line.strip() and not line.strip().startswith(";"))
+_BLANK_RE = re.compile(rb"\n(?=\r?\n)")  # lookahead so runs of blank lines all count
+
+def count_non_comment_lines(data):
+    """Count lines with C-level byte scans: all lines minus comment and blank ones.
 
-total_lines = count_non_comment_lines(GCODE_FILE)
+    Blank lines (LF or CRLF) and comments starting a line are excluded; indented
+    comments and whitespace-only lines are still counted.
+    """
+    lines = data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+    comments = data.count(b"\n;") + (1 if data[:1] == b";" else 0)
+    blanks = len(_BLANK_RE.findall(data)) + (1 if data[:1] in (b"\n", b"\r") else 0)
+    return lines - comments - blanks
+
+# Read the file once; the count and the main loop share the bytes
+with open(GCODE_FILE, "rb") as f:
+    gcode_data = f.read()
+total_lines = count_non_comment_lines(gcode_data)
+gcode = io.BytesIO(gcode_data)
 
 # Initialize tqdm progress bar
+PROGRESS_BATCH = 256  # lines per progress_bar.update() call
 grad = " ⡀⡄⡆⡇⣇⣧⣷⣿"
 #grad = " ░▒▓█"
 progress_bar = tqdm(
     total=total_lines,
-    desc=f"{Color.Text.br_cyan()}Processing G-code{Style.reset()}",
+    desc=f"{_CYN}Processing G-code{_RST}",
     unit="line",
     dynamic_ncols=True,
     leave=True,
     colour="#00ff00",
-    ascii=grad
+    ascii=grad,
+    miniters=PROGRESS_BATCH,
+    mininterval=0.2
 )
 
 # Initialize variables for time calculation
@@ -192,92 +508,74 @@ total_time = None
 elapsed_time = 0
 
 # -------- Main loop --------
-with open(GCODE_FILE, "r") as f:
+with gcode:
     layer = 0
+    pending_lines = 0
 
     if ELEVATOR_MUSIC:
         start_elevator_music()
 
-    for raw_line in f:
+    for raw_line in iter(gcode.readline, b""):
         line = raw_line.strip()
-        if not line or line.startswith(";"):
+        if not line or line.startswith(b";"):
             # Check for layer change
-            if ";LAYER_CHANGE" in raw_line:
+            if b";LAYER_CHANGE" in raw_line:
                 layer += 1
                 take_picture(layer)
 
             # Parse ;TIME and ;TIME_ELAPSED comments
-            if line.startswith(";TIME:"):
+            if line.startswith(b";TIME:"):
                 try:
-                    total_time = int(line.split(":")[1])
+                    total_time = int(line.split(b":")[1])
                 except ValueError:
-                    tqdm.write(f"{Color.Text.br_red()}[!] Invalid TIME format: {line}{Style.reset()}")
+                    tqdm.write(f"{_RED}[!] Invalid TIME format: {line.decode(errors='ignore')}{_RST}")
 
-            elif line.startswith(";TIME_ELAPSED:"):
+            elif line.startswith(b";TIME_ELAPSED:"):
                 try:
-                    elapsed_time = float(line.split(":")[1])
+                    elapsed_time = float(line.split(b":")[1])
                 except ValueError:
-                    tqdm.write(f"{Color.Text.br_red()}[!] Invalid TIME_ELAPSED format: {line}{Style.reset()}")
+                    tqdm.write(f"{_RED}[!] Invalid TIME_ELAPSED format: {line.decode(errors='ignore')}{_RST}")
 
             # Calculate and display remaining time
             if total_time is not None:
                 remaining_time = total_time - elapsed_time
-                progress_bar.set_description(f"{Color.Text.br_cyan()}Remaining: {format_time(remaining_time) if remaining_time!=None else "NaN"}{Style.reset()}")
+                progress_bar.set_description(f"{_CYN}Remaining: {format_time(remaining_time) if remaining_time!=None else "NaN"}{_RST}")
 
             continue
 
         if total_time is None:
-            tqdm.write(f"{Color.Text.br_red()}[!] Missing ;TIME comment in G-code. Remaining time cannot be calculated.{Style.reset()}")
+            tqdm.write(f"{_RED}[!] Missing ;TIME comment in G-code. Remaining time cannot be calculated.{_RST}")
             total_time = -1
 
-        # Handle heating commands
-        if line.startswith("M104"):  # set nozzle temp (no wait)
-            target = parse_temp(line)
-            if target is not None:
-                send_gcode(line)
-
-        elif line.startswith("M109"):  # set nozzle temp (wait)
-            target = parse_temp(line)
-            if target is not None:
-                send_gcode(line)
-                tqdm.write(f"{Color.Text.br_blue()}[🔥] Waiting for nozzle to reach {target}°C...{Style.reset()}")
-                while True:
-                    ser.write(b"M105\n")
-                    resp = ser.readline().decode(errors="ignore").strip()
-                    if resp:
-                        tqdm.write(f"{Color.Text.br_yellow()}[←] {resp}{Style.reset()}")
-                    if "ok" in resp.lower() and f"T:{target}" in resp:
-                        break
-
-        elif line.startswith("M190"):  # set bed temp (wait)
-            target = parse_temp(line)
-            if target is not None:
-                send_gcode(line)
-                tqdm.write(f"{Color.Text.br_blue()}[🔥] Waiting for bed to reach {target}°C...{Style.reset()}")
-                while True:
-                    ser.write(b"M105\n")  # Request temperature status
-                    resp = ser.readline().decode(errors="ignore").strip()
-                    if resp:
-                        tqdm.write(f"{Color.Text.br_yellow()}[←] {resp}{Style.reset()}")
-                        if "ok" in resp.lower():
-                            # Extract bed temperature from the response
-                            if "B:" in resp:
-                                try:
-                                    current_temp = float(resp.split("B:")[1].split()[0])
-                                    if current_temp >= target:
-                                        break
-                                except (IndexError, ValueError):
-                                    pass
+        # Inline comments would hide the checksum from the printer
+        line = clean_line(line)
 
+        # Handle heating commands, everything else goes straight out
+        sp = line.find(b" ")
+        handler = HANDLERS.get(line if sp < 0 else line[:sp])
+        if handler:
+            handler(line)
         else:
             send_gcode(line)
 
-        progress_bar.update(1)  # Update progress bar
+        pending_lines += 1
+        if pending_lines >= PROGRESS_BATCH:
+            progress_bar.update(pending_lines)  # Update progress bar
+            pending_lines = 0
+
+    progress_bar.update(pending_lines)
 
 # Cleanup
+send_gcode(b"M155 S0")
+drain()
 progress_bar.close()
 if cap:
+    camera_stop.set()
+    grab_thread.join()
     cap.release()
+    write_q.join()  # let queued frames finish saving
+reader_running = False
+reader_thread.join()
 ser.close()
 if ELEVATOR_MUSIC:
     stop_elevator_music()